@@ -1,28 +1,62 @@
 from astropy.table import Table, Column
-from astropy.io import fits
 from astropy.table import Table
 import numpy as np
+import itertools
+import operator
+from typing import List, Optional
+
+try:
+    import numexpr
+except ImportError:
+    numexpr = None
+
+# Unique placeholder names for the arrays and scalars referenced by Column expressions
+_placeholders = itertools.count()
+
+# Operands of a Column expression deeper or wider than these are evaluated and used as a single array,
+# which keeps expressions within the limits of the Python parser and of numexpr
+MAX_EXPRESSION_DEPTH = 32
+MAX_EXPRESSION_OPERANDS = 32
+
+def _keyList(keys):
+    """
+    Convert an array of primary keys into a list of strings, decoding byte strings once as a whole array.
+
+    Args:
+        keys (np.ndarray): The stripped primary key values.
+
+    Returns:
+        list: The primary key values as strings.
+    """
+    if keys.dtype.kind == 'S':
+        keys = np.char.decode(keys)
+    return keys.tolist()
 
 class Data:
-    def __init__(self, dataPath: str, primaryKey: str = ""):
+    def __init__(self, dataPath: str, primaryKey: str = "", columns: Optional[List[str]] = None):
         """
         Constructor for the Data class.
 
         Args:
             dataPath (str): The path to the FITS data file.
             primaryKey (str, optional): The primary key column name.
+            columns (List[str], optional): The names of the columns to keep in addition to the primary key. If not specified, all columns are kept.
 
         Raises:
             FileNotFoundError: If the specified file does not exist.
         """
         try:
-            dataFile = fits.open(dataPath, memmap=True)
-            self.table = Table(dataFile[1].data)
+            self.table = Table.read(dataPath, format='fits', memmap=True, character_as_bytes=True)
             if primaryKey == "":
                 primaryKey = self.table.columns[0].name
+            if columns is not None:
+                self.table.keep_columns([primaryKey] + [name for name in columns if name != primaryKey])
             primaryKeyColumn = self.table[primaryKey]
             self.primaryKey = primaryKey
-            self.primaryKeyList = [x.strip() for x in list(np.array(primaryKeyColumn))]
+            self.primaryKeyArray = np.char.strip(np.asarray(primaryKeyColumn))
+            self._primaryKeyList = None
+            self._primaryKeyIndex = None
+            self._primaryKeyOrder = None
         except FileNotFoundError:
             raise FileNotFoundError("File Not Found: The specified file does not exist.")
 
@@ -41,9 +75,130 @@ class Data:
         data = cls.__new__(cls)
         data.table = table
         data.primaryKey = primaryKey
-        data.primaryKeyList = [x.strip() for x in list(np.array(table[primaryKey]))]
+        data.primaryKeyArray = np.char.strip(np.asarray(table[primaryKey]))
+        data._primaryKeyList = None
+        data._primaryKeyIndex = None
+        data._primaryKeyOrder = None
         return data
 
+    @classmethod
+    def from_mask(cls, parent: "Data", mask: np.ndarray):
+        """
+        Create a Data object from the rows of an existing Data object selected by a boolean mask, reusing its stripped primary keys.
+
+        Args:
+            parent (Data): The Data object to filter.
+            mask (np.ndarray): A boolean array with one entry per row of parent.table.
+
+        Returns:
+            Data: A new instance of the Data class.
+        """
+        data = cls.__new__(cls)
+        data.table = parent.table[mask]
+        data.primaryKey = parent.primaryKey
+        data.primaryKeyArray = parent.primaryKeyArray[mask]
+        data._primaryKeyList = None
+        data._primaryKeyIndex = None
+        data._primaryKeyOrder = None
+        return data
+
+    @property
+    def primaryKeyList(self):
+        """
+        The primary key values as a list of strings, built on first access.
+
+        Returns:
+            list: A list of primary key values.
+        """
+        if self._primaryKeyList is None:
+            self._primaryKeyList = _keyList(self.primaryKeyArray)
+        return self._primaryKeyList
+
+    @property
+    def primaryKeyIndex(self):
+        """
+        A mapping from each primary key value to its row index in the table, built on first access.
+        A key that appears in several rows maps to the first of them, as in rowPositions.
+
+        Returns:
+            dict: The row index of each primary key value.
+        """
+        if self._primaryKeyIndex is None:
+            index = {}
+            for i, k in enumerate(self.primaryKeyList):
+                index.setdefault(k, i)
+            self._primaryKeyIndex = index
+        return self._primaryKeyIndex
+
+    def rowIndices(self, keys):
+        """
+        Find the rows of the table whose primary key is one of the given keys, using a binary search over the sorted primary keys.
+        Every row of a key that appears in several rows is returned.
+
+        Args:
+            keys (np.ndarray or list): The primary key values to look up.
+
+        Returns:
+            np.ndarray: The sorted row indices of the keys that are present in the table.
+        """
+        keys = self.matchingKeys(keys)
+        if len(keys) == 0 or len(self.primaryKeyArray) == 0:
+            return np.zeros(0, dtype=np.intp)
+        order, sortedKeys = self.sortedPrimaryKeys()
+        left = np.searchsorted(sortedKeys, keys, side='left')
+        counts = np.searchsorted(sortedKeys, keys, side='right') - left
+        # Expand each [left, right) range of the sorted keys into its positions
+        offsets = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        return np.unique(order[np.repeat(left, counts) + offsets])
+
+    def rowPositions(self, keys):
+        """
+        Find the row of the table for each of the given primary keys, using a binary search over the sorted primary keys.
+        A key that appears in several rows is matched to the first of them.
+
+        Args:
+            keys (np.ndarray or list): The primary key values to look up.
+
+        Returns:
+            tuple: An array with the row index for each key, and a boolean array that is True where the key is present in the table.
+        """
+        keys = self.matchingKeys(keys)
+        if len(keys) == 0 or len(self.primaryKeyArray) == 0:
+            return np.zeros(len(keys), dtype=np.intp), np.zeros(len(keys), dtype=bool)
+        order, sortedKeys = self.sortedPrimaryKeys()
+        positions = np.minimum(np.searchsorted(sortedKeys, keys, side='left'), len(sortedKeys) - 1)
+        found = sortedKeys[positions] == keys
+        return order[positions], found
+
+    def matchingKeys(self, keys):
+        """
+        Convert primary key values to the representation of primaryKeyArray, which stays as bytes when read from FITS.
+
+        Args:
+            keys (np.ndarray or list): The primary key values.
+
+        Returns:
+            np.ndarray: The key values as byte strings or strings, matching primaryKeyArray.
+        """
+        keys = np.asarray(keys)
+        if self.primaryKeyArray.dtype.kind == 'S' and keys.dtype.kind == 'U':
+            keys = np.char.encode(keys)
+        elif self.primaryKeyArray.dtype.kind == 'U' and keys.dtype.kind == 'S':
+            keys = np.char.decode(keys)
+        return keys
+
+    def sortedPrimaryKeys(self):
+        """
+        Get the stable sort order of the primary keys and the sorted keys, computed on first use.
+
+        Returns:
+            tuple: The row index of each sorted key, and the sorted primary keys.
+        """
+        if self._primaryKeyOrder is None:
+            self._primaryKeyOrder = np.argsort(self.primaryKeyArray, kind='stable')
+            self._sortedPrimaryKeys = self.primaryKeyArray[self._primaryKeyOrder]
+        return self._primaryKeyOrder, self._sortedPrimaryKeys
+
     def __str__(self):
         """
         Return a string representation of the Data object.
@@ -67,7 +222,120 @@ class Column:
         """
         self.data = data  # Extract the Astropy Table from the Data object
         self.columnName = columnName
-        self.result = result if result is not None else data.table[columnName]
+        self._result = np.asarray(result if result is not None else data.table[columnName])
+        self.expr = f"_c{next(_placeholders)}"
+        self.locals = {self.expr: self._result}
+        self.depth = 0
+
+    @classmethod
+    def from_expression(cls, data: Data, columnName: str, expr: str, local_dict: dict, depth: int = 1):
+        """
+        Create a Column whose values are defined by an expression and evaluated on first use.
+
+        Args:
+            data (Data): The Data object that this column belongs to.
+            columnName (str): The name of the column.
+            expr (str): The expression over the placeholders in local_dict.
+            local_dict (dict): A mapping of placeholder names to arrays or scalars.
+            depth (int, optional): The number of nested operations in expr (default is 1).
+
+        Returns:
+            Column: A new instance of the Column class.
+        """
+        column = cls.__new__(cls)
+        column.data = data
+        column.columnName = columnName
+        column._result = None
+        column.expr = expr
+        column.locals = local_dict
+        column.depth = depth
+        return column
+
+    @property
+    def result(self):
+        """
+        The values of the column, evaluating its expression once if needed.
+
+        Returns:
+            np.ndarray: The values of the column.
+        """
+        if self._result is None:
+            self._result = self.evaluate()
+        return self._result
+
+    def evaluate(self):
+        """
+        Evaluate the Column's expression in a single pass, using numexpr when it is installed and gives the same result as NumPy.
+
+        Returns:
+            np.ndarray: The values of the expression.
+        """
+        if numexpr is not None and self.numexprExact():
+            try:
+                return numexpr.evaluate(self.expr, local_dict=self.locals)
+            except (TypeError, ValueError, NotImplementedError):
+                pass
+        # NumPy imports modules while raising some of its errors, so __import__ must stay available for them to come through
+        return np.asarray(eval(self.expr, {"__builtins__": {"__import__": __import__}}, self.locals))
+
+    def numexprExact(self):
+        """
+        Check whether numexpr evaluates the Column's expression with the same dtypes and results as NumPy.
+
+        numexpr casts unsigned and small integer types to int64, float32 to float64, and returns 0 for
+        negative integer powers, so only float64 operands, and int32 or int64 operands without '**', qualify.
+
+        Returns:
+            bool: True if the expression can be evaluated with numexpr.
+        """
+        hasPower = '**' in self.expr
+        for value in self.locals.values():
+            if isinstance(value, np.ndarray):
+                if value.dtype == np.float64:
+                    continue
+                if value.dtype in (np.int32, np.int64) and not hasPower:
+                    continue
+                return False
+            if isinstance(value, float):
+                continue
+            if isinstance(value, int) and abs(value) < 2**31 and not hasPower:
+                continue
+            return False
+        return True
+
+    def combinedExpression(self, operation: str, other):
+        """
+        Build the expression for applying an operation between this column and another Column or a scalar.
+
+        Args:
+            operation (str): The operation symbol (e.g., '+', '-', '*', '/', '**').
+            other (Column, int, float): The other operand.
+
+        Returns:
+            tuple: The combined expression, its mapping of placeholders, and its depth.
+        """
+        selfExpr, local_dict, depth = self.operand()
+        local_dict = dict(local_dict)
+        if isinstance(other, Column):
+            otherExpr, otherLocals, otherDepth = other.operand()
+            local_dict.update(otherLocals)
+            depth = max(depth, otherDepth)
+        else:
+            otherExpr = f"_c{next(_placeholders)}"
+            local_dict[otherExpr] = other
+        return f"({selfExpr}) {operation} ({otherExpr})", local_dict, depth + 1
+
+    def operand(self):
+        """
+        Get the expression to use for this column as an operand, evaluating it first if it is too deep or references too many operands.
+
+        Returns:
+            tuple: The expression, its mapping of placeholders, and its depth.
+        """
+        if self.depth >= MAX_EXPRESSION_DEPTH or len(self.locals) > MAX_EXPRESSION_OPERANDS // 2:
+            placeholder = f"_c{next(_placeholders)}"
+            return placeholder, {placeholder: self.result}, 0
+        return self.expr, self.locals, self.depth
 
     def newColumnName(self, operation: str, otherColumn=None):
         """
@@ -91,14 +359,70 @@ class Column:
 
         Args:
             newColumnName (str): The name for the new column.
-            result (astropy.table.Column): The result column to update the data attribute.
+            result (np.ndarray): The values of the new column.
         """
-        updated_data = self.data
-        updated_data.table = Table(self.data.table)
-        updated_data.table[newColumnName] = result
-        self.data = updated_data
+        self.data.table[newColumnName] = result
         self.columnName = newColumnName
 
+    def materialize(self, columnName: str = ""):
+        """
+        Write the Column's result into its Data table so it persists as a regular column, and read the Column's values from that table column afterwards.
+
+        Args:
+            columnName (str, optional): The name for the new column. If not specified, the Column's current name is used.
+
+        Returns:
+            Column: This Column, now backed by the new table column.
+        """
+        if columnName == "":
+            columnName = self.columnName
+        self.updatedData(columnName, self.result)
+        self._result = np.asarray(self.data.table[columnName])
+        self.expr = f"_c{next(_placeholders)}"
+        self.locals = {self.expr: self._result}
+        self.depth = 0
+        return self
+
+    def _binop(self, operation: str, other):
+        """
+        Apply an arithmetic operation between this column and another Column or a scalar.
+
+        Args:
+            operation (str): The operation symbol (e.g., '+', '-', '*', '/', '**').
+            other (Column, int, float): The other operand.
+
+        Returns:
+            Column: A new Column containing the result of the operation.
+        """
+        if isinstance(other, Column):
+            newColumnName = self.newColumnName(operation, other.columnName)
+        elif isinstance(other, (int, float)):
+            newColumnName = self.newColumnName(operation, str(other))
+        else:
+            raise TypeError(f"Unsupported operand type for {operation}")
+        expr, local_dict, depth = self.combinedExpression(operation, other)
+        return Column.from_expression(self.data, newColumnName, expr, local_dict, depth)
+
+    def _compare(self, op, operation: str, other):
+        """
+        Filter the Data to the rows where a comparison between this column and another Column or a scalar is True.
+
+        Args:
+            op (callable): The comparison function from the operator module.
+            operation (str): The operation symbol (e.g., '<', '<=', '==').
+            other (Column, int, float): The other operand.
+
+        Returns:
+            Data: A new Data object containing rows where the comparison is True.
+        """
+        if isinstance(other, Column):
+            otherResult = other.result
+        elif isinstance(other, (int, float)):
+            otherResult = other
+        else:
+            raise TypeError(f"Unsupported operand type for {operation}")
+        return Data.from_mask(self.data, np.asarray(op(self.result, otherResult)))
+
     # Binary operations (+, -, *, /, **)
 
     def __add__(self, other):
@@ -111,17 +435,7 @@ class Column:
         Returns:
             Column: A new Column containing the result of the addition.
         """
-        if isinstance(other, Column):
-            result = self.data.table[self.columnName] + other.data.table[other.columnName]
-            newColumnName = self.newColumnName('+', other.columnName)
-        elif isinstance(other, (int, float)):
-            result = self.data.table[self.columnName] + other
-            newColumnName = self.newColumnName('+', str(other))
-        else:
-            raise TypeError("Unsupported operand type for +")
-        
-        self.updatedData(newColumnName, result)
-        return Column(self.data, newColumnName, result)
+        return self._binop('+', other)
 
     def __sub__(self, other):
         """
@@ -133,17 +447,7 @@ class Column:
         Returns:
             Column: A new Column containing the result of the subtraction.
         """
-        if isinstance(other, Column):
-            result = self.data.table[self.columnName] - other.data.table[other.columnName]
-            newColumnName = self.newColumnName('-', other.columnName)
-        elif isinstance(other, (int, float)):
-            result = self.data.table[self.columnName] - other
-            newColumnName = self.newColumnName('-', str(other))
-        else:
-            raise TypeError("Unsupported operand type for -")
-        
-        self.updatedData(newColumnName, result)
-        return Column(self.data, newColumnName, result)
+        return self._binop('-', other)
 
     def __mul__(self, other):
         """
@@ -155,17 +459,7 @@ class Column:
         Returns:
             Column: A new Column containing the result of the multiplication.
         """
-        if isinstance(other, Column):
-            result = self.data.table[self.columnName] * other.data.table[other.columnName]
-            newColumnName = self.newColumnName('*', other.columnName)
-        elif isinstance(other, (int, float)):
-            result = self.data.table[self.columnName] * other
-            newColumnName = self.newColumnName('*', str(other))
-        else:
-            raise TypeError("Unsupported operand type for *")
-        
-        self.updatedData(newColumnName, result)
-        return Column(self.data, newColumnName, result)
+        return self._binop('*', other)
 
     def __truediv__(self, other):
         """
@@ -178,20 +472,11 @@ class Column:
             Column: A new Column containing the result of the division.
         """
         if isinstance(other, Column):
-            if np.any(other.data.table[other.columnName] == 0):
-                raise ValueError("Division by zero encountered.")
-            result = self.data.table[self.columnName] / other.data.table[other.columnName]
-            newColumnName = self.newColumnName('/', other.columnName)
-        elif isinstance(other, (int, float)):
-            if other == 0:
+            if np.any(other.result == 0):
                 raise ValueError("Division by zero encountered.")
-            result = self.data.table[self.columnName] / other
-            newColumnName = self.newColumnName('/', str(other))
-        else:
-            raise TypeError("Unsupported operand type for /")
-        
-        self.updatedData(newColumnName, result)
-        return Column(self.data, newColumnName, result)
+        elif isinstance(other, (int, float)) and other == 0:
+            raise ValueError("Division by zero encountered.")
+        return self._binop('/', other)
 
     def __pow__(self, other):
         """
@@ -203,17 +488,7 @@ class Column:
         Returns:
             Column: A new Column containing the result of the exponentiation.
         """
-        if isinstance(other, Column):
-            result = self.data.table[self.columnName] ** other.data.table[other.columnName]
-            newColumnName = self.newColumnName('**', other.columnName)
-        elif isinstance(other, (int, float)):
-            result = self.data.table[self.columnName] ** other
-            newColumnName = self.newColumnName('**', str(other))
-        else:
-            raise TypeError("Unsupported operand type for **")
-        
-        self.updatedData(newColumnName, result)
-        return Column(self.data, newColumnName, result)
+        return self._binop('**', other)
         
     # Inequality operations (<, <=, >, >=, ==, !=)
     def __lt__(self, other):
@@ -226,16 +501,7 @@ class Column:
         Returns:
             Data: A new Data object containing rows where the comparison is True.
         """
-        if isinstance(other, Column):
-            result = self.data.table[self.columnName] < other.data.table[other.columnName]
-        elif isinstance(other, (int, float)):
-            result = self.data.table[self.columnName] < other
-        else:
-            raise TypeError("Unsupported operand type for <")
-        
-        mask = np.array(result, dtype=bool)
-        filtered_data = self.data.table[mask]
-        return Data.from_table(filtered_data, primaryKey=self.data.primaryKey)
+        return self._compare(operator.lt, '<', other)
 
     def __le__(self, other):
         """
@@ -247,16 +513,7 @@ class Column:
         Returns:
             Data: A new Data object containing rows where the comparison is True.
         """
-        if isinstance(other, Column):
-            result = self.data.table[self.columnName] <= other.data.table[other.columnName]
-        elif isinstance(other, (int, float)):
-            result = self.data.table[self.columnName] <= other
-        else:
-            raise TypeError("Unsupported operand type for <=")
-        
-        mask = np.array(result, dtype=bool)
-        filtered_data = self.data.table[mask]
-        return Data.from_table(filtered_data, primaryKey=self.data.primaryKey)
+        return self._compare(operator.le, '<=', other)
 
     def __gt__(self, other):
         """
@@ -268,16 +525,7 @@ class Column:
         Returns:
             Data: A new Data object containing rows where the comparison is True.
         """
-        if isinstance(other, Column):
-            result = self.data.table[self.columnName] > other.data.table[other.columnName]
-        elif isinstance(other, (int, float)):
-            result = self.data.table[self.columnName] > other
-        else:
-            raise TypeError("Unsupported operand type for >")
-        
-        mask = np.array(result, dtype=bool)
-        filtered_data = self.data.table[mask]
-        return Data.from_table(filtered_data, primaryKey=self.data.primaryKey)
+        return self._compare(operator.gt, '>', other)
 
     def __ge__(self, other):
         """
@@ -289,16 +537,7 @@ class Column:
         Returns:
             Data: A new Data object containing rows where the comparison is True.
         """
-        if isinstance(other, Column):
-            result = self.data.table[self.columnName] >= other.data.table[other.columnName]
-        elif isinstance(other, (int, float)):
-            result = self.data.table[self.columnName] >= other
-        else:
-            raise TypeError("Unsupported operand type for >=")
-        
-        mask = np.array(result, dtype=bool)
-        filtered_data = self.data.table[mask]
-        return Data.from_table(filtered_data, primaryKey=self.data.primaryKey)
+        return self._compare(operator.ge, '>=', other)
 
     def __eq__(self, other):
         """
@@ -310,16 +549,7 @@ class Column:
         Returns:
             Data: A new Data object containing rows where the comparison is True.
         """
-        if isinstance(other, Column):
-            result = self.data.table[self.columnName] == other.data.table[other.columnName]
-        elif isinstance(other, (int, float)):
-            result = self.data.table[self.columnName] == other
-        else:
-            raise TypeError("Unsupported operand type for ==")
-        
-        mask = np.array(result, dtype=bool)
-        filtered_data = self.data.table[mask]
-        return Data.from_table(filtered_data, primaryKey=self.data.primaryKey)
+        return self._compare(operator.eq, '==', other)
 
     def __ne__(self, other):
         """
@@ -331,16 +561,7 @@ class Column:
         Returns:
             Data: A new Data object containing rows where the comparison is True.
         """
-        if isinstance(other, Column):
-            result = self.data.table[self.columnName] != other.data.table[other.columnName]
-        elif isinstance(other, (int, float)):
-            result = self.data.table[self.columnName] != other
-        else:
-            raise TypeError("Unsupported operand type for !=")
-        
-        mask = np.array(result, dtype=bool)
-        filtered_data = self.data.table[mask]
-        return Data.from_table(filtered_data, primaryKey=self.data.primaryKey)
+        return self._compare(operator.ne, '!=', other)
 
     def __str__(self):
         """
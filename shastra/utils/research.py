@@ -1,6 +1,4 @@
 import numpy as np
-from astropy.stats import bootstrap
-from astropy.utils import NumpyRNGContext
 from scipy import stats
 import matplotlib.pyplot as plt
 import matplotlib as mpl
@@ -8,6 +6,59 @@ from typing import List, Dict
 from .data import Data, Column
 from matplotlib.ticker import AutoMinorLocator
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# Bootstrap workloads of at least this many resampled elements use the Numba kernel when it is available
+NUMBA_BOOTSTRAP_THRESHOLD = 10_000_000
+
+# The NumPy bootstrap resamples in blocks of about this many elements to bound memory usage
+BOOTSTRAP_BLOCK_SIZE = 10_000_000
+
+if numba is not None:
+    # NaN-aware, so fastmath leaves out the 'nnan' and 'ninf' flags
+    @numba.njit(parallel=True, fastmath={'nsz', 'arcp', 'contract', 'afn', 'reassoc'}, cache=True)
+    def _bootstrapStatistics(arr, bootstrapN, seed):
+        """
+        Compute the NaN-ignoring mean, median and standard deviation of each bootstrap resample of arr.
+
+        Args:
+            arr (np.ndarray): The input array.
+            bootstrapN (int): The number of bootstrap samples to generate.
+            seed (int): The seed for the resample of index 0; resample b uses seed + b.
+
+        Returns:
+            np.ndarray: A (bootstrapN, 3) array of the mean, median and standard deviation of each resample.
+        """
+        n = arr.shape[0]
+        out = np.empty((bootstrapN, 3))
+        for b in numba.prange(bootstrapN):
+            np.random.seed(seed + b)
+            resample = np.empty(n)
+            count = 0
+            total = 0.0
+            for i in range(n):
+                x = arr[np.random.randint(0, n)]
+                if not np.isnan(x):
+                    resample[count] = x
+                    count += 1
+                    total += x
+            if count == 0:
+                out[b, 0] = np.nan
+                out[b, 1] = np.nan
+                out[b, 2] = np.nan
+                continue
+            mean = total / count
+            squares = 0.0
+            for i in range(count):
+                squares += (resample[i] - mean) ** 2
+            out[b, 0] = mean
+            out[b, 1] = np.median(resample[:count])
+            out[b, 2] = np.sqrt(squares / count)
+        return out
+
 class Sample:
     def __init__(self, name: str = "Sample", ids: List[str] = []):
         """
@@ -15,16 +66,17 @@ class Sample:
 
         Args:
             name (str): The name of the sample (default is "Sample").
-            ids (List[str]): A list of identifiers associated with the sample, typically the primaryKey of Daa.
+            ids (List[str]): A list of identifiers associated with the sample, typically the primaryKey of Daa. Byte strings, such as the values of Data.primaryKeyArray, are accepted too. It should not be modified after construction.
         """
         self.name = name 
         self.ids = ids
+        self.id_arr = np.asarray(list(dict.fromkeys(x.encode() if isinstance(x, str) else x for x in (i.strip() for i in ids))))
 
     def __str__(self):
         """
         Return a string representation of the Sample object.
         """
-        return f"<Sample> \n \tName: {self.name} \n \t IDs: {', '.join(self.ids)} \n"
+        return f"<Sample> \n \tName: {self.name} \n \t IDs: {', '.join(i.decode() if isinstance(i, bytes) else i for i in self.ids)} \n"
 
 class Research:
     def __init__(self, data: Data , mainSample: Sample, controls: List[Sample]=[], parameters: Dict[str, Column]={}):
@@ -41,6 +93,8 @@ class Research:
         self.mainSample = mainSample
         self.controls = controls
         self.parameters = parameters
+        self._indexCache = {}
+        self._paramArrays: Dict[str, np.ndarray] = {name: self.parameterArray(column) for name, column in parameters.items()}
 
     def getValue(self, sample: Sample, parameterName: str):
         """
@@ -51,23 +105,85 @@ class Research:
             parameterName (str): The name of the parameter.
 
         Returns:
-            list: A list of parameter values for the given sample.
+            np.ndarray: An array of parameter values for the given sample.
+        """
+        return self._parameterValues(parameterName)[self._sampleIndices(sample)]
+
+    def getValuesForAllSamples(self, parameterName: str):
+        """
+        Get the parameter values associated with the main sample and every control sample in one pass.
+
+        Args:
+            parameterName (str): The name of the parameter.
+
+        Returns:
+            Dict[str, np.ndarray]: A dictionary mapping each sample name to its parameter values, starting with the main sample.
+        """
+        parameterValues = self._parameterValues(parameterName)
+        return {sample.name: parameterValues[self._sampleIndices(sample)] for sample in [self.mainSample] + self.controls}
+
+    def _sampleIndices(self, sample: Sample):
+        """
+        Get the sorted row indices of the research data that belong to a sample.
+
+        Args:
+            sample (Sample): The sample, matched by name against the main and control samples.
+
+        Returns:
+            np.ndarray: The row indices of the sample's identifiers in the data table.
         """
-        indices = []
-        primaryKeyList = self.data.primaryKeyList
-        parameterColumn = self.data.table[self.parameters[parameterName].columnName]
-        parameterList = list(np.array(parameterColumn))
         if sample.name == self.mainSample.name:
-            sampleList = self.mainSample.ids
+            sampleIds = self.mainSample.id_arr
         else:
             for controls in self.controls:
                 if sample.name == controls.name:
-                    sampleList = controls.ids
-        for index, primaryKey in enumerate(primaryKeyList):
-            if primaryKey in sampleList:
-                indices.append(index)
-        value = [parameterList[x] for x in indices]
-        return value
+                    sampleIds = controls.id_arr
+        cached = self._indexCache.get(id(sampleIds))
+        if cached is not None and cached[0] is sampleIds:
+            indices = cached[1]
+        else:
+            indices = self.data.rowIndices(sampleIds)
+            self._indexCache[id(sampleIds)] = (sampleIds, indices)
+        return indices
+
+    def _parameterValues(self, parameterName: str):
+        """
+        Get the precomputed values of a parameter for every row of the research data.
+
+        Args:
+            parameterName (str): The name of the parameter.
+
+        Returns:
+            np.ndarray: The parameter values, in the order of the rows of the data table.
+        """
+        if parameterName not in self._paramArrays:
+            self._paramArrays[parameterName] = self.parameterArray(self.parameters[parameterName])
+        return self._paramArrays[parameterName]
+
+    def parameterArray(self, parameter: Column):
+        """
+        Get the values of a parameter column for every row of the research data.
+
+        A parameter built on another Data object is read from the research data by column name, or, for derived
+        columns that are not in the table, lined up with the research data by primary key.
+
+        Args:
+            parameter (Column): The parameter column.
+
+        Returns:
+            np.ndarray: The parameter values, in the order of the rows of the data table.
+
+        Raises:
+            KeyError: If the parameter is not a column of the research data and some research rows are missing from the Data it was built on.
+        """
+        if parameter.data is self.data:
+            return np.asarray(parameter.result)
+        if parameter.columnName in self.data.table.colnames:
+            return np.asarray(self.data.table[parameter.columnName])
+        rows, found = parameter.data.rowPositions(self.data.primaryKeyArray)
+        if not np.all(found):
+            raise KeyError(f"Parameter '{parameter.columnName}' is not a column of the research data and {np.count_nonzero(~found)} research rows are missing from the Data it was built on. Call materialize() on it, or build it on the research data.")
+        return np.asarray(parameter.result)[rows]
 
     def printValue(self, sample: Sample, parameterName: str):
         """
@@ -78,23 +194,48 @@ class Research:
             parameterName (str): The name of the parameter.
         """
         print(parameterName + " for " + sample.name)
-        print(self.getValue(sample, parameterName))
+        print(self.getValue(sample, parameterName).tolist())
 
-    def interval(self, arr, bootstrapN=10000):
+    def interval(self, arr, bootstrapN=10000, method="numpy", seed=1):
         """
         Compute the interval for a given array using bootstrap resampling.
 
+        The NumPy and Numba methods draw different random resamples, so their results agree only within bootstrap noise.
+        The default NumPy method gives the same results whether or not Numba is installed.
+
         Args:
             arr (list or np.ndarray): The input array for which to compute the interval.
             bootstrapN (int): The number of bootstrap samples to generate (default is 10,000).
+            method (str): "numpy", "numba", or "auto" to use Numba when it is installed and len(arr) * bootstrapN reaches NUMBA_BOOTSTRAP_THRESHOLD (default is "numpy").
+            seed (int): The seed for the random resamples (default is 1).
 
         Returns:
             list: A list containing the standard deviations of the mean, median, and standard deviation of the resampled data.
+
+        Raises:
+            ValueError: If method is not one of "auto", "numpy" or "numba".
+            ImportError: If method is "numba" and Numba is not installed.
         """
-        arr = np.array(arr)
-        test_statistic = lambda x: (np.nanmean(x), np.nanmedian(x), np.nanstd(x))
-        with NumpyRNGContext(1):
-            bootresult = bootstrap(arr, bootstrapN, bootfunc=test_statistic)
+        if method not in ("auto", "numpy", "numba"):
+            raise ValueError(f"Unknown bootstrap method: {method}")
+        if method == "numba" and numba is None:
+            raise ImportError("The numba bootstrap method requires Numba to be installed.")
+        arr = np.asarray(arr, dtype=float)
+        if method == "auto":
+            method = "numba" if numba is not None and len(arr) * bootstrapN >= NUMBA_BOOTSTRAP_THRESHOLD else "numpy"
+        if method == "numba":
+            bootresult = _bootstrapStatistics(arr, bootstrapN, seed)
+        else:
+            rng = np.random.default_rng(seed)
+            bootresult = np.empty((bootstrapN, 3))
+            # Resample in blocks so that the resampled matrix stays around BOOTSTRAP_BLOCK_SIZE elements
+            blockSize = max(1, BOOTSTRAP_BLOCK_SIZE // max(len(arr), 1))
+            for start in range(0, bootstrapN, blockSize):
+                stop = min(start + blockSize, bootstrapN)
+                resampled = arr[rng.integers(0, len(arr), size=(stop - start, len(arr)))]
+                bootresult[start:stop, 0] = np.nanmean(resampled, axis=1)
+                bootresult[start:stop, 1] = np.nanmedian(resampled, axis=1)
+                bootresult[start:stop, 2] = np.nanstd(resampled, axis=1)
         return [np.nanstd(bootresult[:, 0]), np.nanstd(bootresult[:, 1]), np.nanstd(bootresult[:, 2])]
 
     def printStatistics(self, sample: Sample, parameterName: str):
@@ -105,10 +246,20 @@ class Research:
             sample (Sample): The sample for which to print statistics.
             parameterName (str): The name of the parameter.
         """
-        value = self.getValue(sample, parameterName)
+        self._printStatistics(self.getValue(sample, parameterName), sample.name, parameterName)
+
+    def _printStatistics(self, value, sampleName: str, parameterName: str):
+        """
+        Print statistics (mean, median, and standard deviation) for already retrieved parameter values.
+
+        Args:
+            value (np.ndarray): The parameter values of the sample.
+            sampleName (str): The name of the sample.
+            parameterName (str): The name of the parameter.
+        """
         error = self.interval(value)
         print("-" * 80)
-        print(sample.name + " statistics for " + parameterName)
+        print(sampleName + " statistics for " + parameterName)
         print("Mean: ", np.nanmean(value), "+-", error[0])
         print("Median: ", np.nanmedian(value), "+-", error[1])
         print("Standard Deviation: ", np.nanstd(value), "+-", error[2])
@@ -123,14 +274,26 @@ class Research:
             sample2 (Sample): The second sample for comparison.
             parameterName (str): The name of the parameter.
         """
-        value1 = self.getValue(sample1, parameterName)
-        value2 = self.getValue(sample2, parameterName)
+        self._printCorrelation(self.getValue(sample1, parameterName), self.getValue(sample2, parameterName), sample1.name, sample2.name)
+
+    def _printCorrelation(self, value1, value2, sampleName1: str, sampleName2: str):
+        """
+        Print correlation statistics (KS Test and Anderson-Darling Test) between already retrieved parameter values of two samples.
+
+        Args:
+            value1 (np.ndarray): The parameter values of the first sample.
+            value2 (np.ndarray): The parameter values of the second sample.
+            sampleName1 (str): The name of the first sample.
+            sampleName2 (str): The name of the second sample.
+        """
+        value1 = np.asarray(value1)
+        value2 = np.asarray(value2)
         print("-" * 80)
-        print("KS Test between " + sample1.name + " and " + sample2.name)
+        print("KS Test between " + sampleName1 + " and " + sampleName2)
         print(stats.ks_2samp(value2, value1))
         print("-" * 50)
-        print("AD Test between " + sample1.name + " and " + sample2.name)
-        print(stats.anderson_ksamp(np.array([value2, value1])))
+        print("AD Test between " + sampleName1 + " and " + sampleName2)
+        print(stats.anderson_ksamp([value2, value1]))
         print("-" * 80)
 
     def printStatisticsAll(self, parameterName: str):
@@ -140,9 +303,8 @@ class Research:
         Args:
             parameterName (str): The name of the parameter.
         """
-        self.printStatistics(self.mainSample, parameterName)
-        for controls in self.controls:
-            self.printStatistics(controls, parameterName)
+        for sampleName, value in self.getValuesForAllSamples(parameterName).items():
+            self._printStatistics(value, sampleName, parameterName)
     
     def printCorrelationAll(self, parameterName: str):
         """
@@ -151,8 +313,10 @@ class Research:
         Args:
             parameterName (str): The name of the parameter.
         """
+        values = self.getValuesForAllSamples(parameterName)
+        mainValue = values[self.mainSample.name]
         for controls in self.controls:
-            self.printCorrelation(self.mainSample, controls, parameterName)
+            self._printCorrelation(mainValue, values[controls.name], self.mainSample.name, controls.name)
 
     def plotSingleHistogram(self, sample: Sample, parameterName: str, toSave=False, filename="", xLabel="", yLabel="Count", **kwargs):
         """
@@ -196,42 +360,86 @@ class Research:
             filename (str): The filename to use if saving the plot (default is ""). If not specified, the parameterName is used.
             xLabel (str): The label for the x-axis (default is ""). If not specified, parameterName is used.
             yLabel (str): The label for the y-axis (default is "Count").
-            mainSampleBins (int): The number of bins for the main sample's histogram (default is 15).
-            mainSampleRange (tuple): The range for the main sample's histogram (default is None).
+            mainSampleBins (int): The number of bins for the main sample's histogram, also used for the control samples unless bins is passed in kwargs (default is 15).
+            mainSampleRange (tuple): The range for the main sample's histogram, also used for the control samples unless range is passed in kwargs (default is None).
             **kwargs: Additional keyword arguments for customizing the histograms.
         """
-        if xLabel == "": 
-            xLabel = parameterName
         mpl.rcParams['font.size'] = 14
         fig, ax = plt.subplots()
-        plt.xlabel(xLabel)
-        plt.ylabel(yLabel)
-        value = self.getValue(self.mainSample, parameterName)
-        plt.hist(value, label=self.mainSample.name, ec="black", histtype='step', range=mainSampleRange, fc=(0.5, 0.5, 0.5, 0.6), bins=mainSampleBins)
-        for controls in self.controls:
-            value = self.getValue(controls, parameterName)
-            plt.hist(value, label=controls.name, histtype='stepfilled', **kwargs)
-        plt.legend()
-        ax.xaxis.set_minor_locator(AutoMinorLocator())
-        ax.tick_params(which='minor', length=2, color='k')
-        ax.yaxis.set_minor_locator(AutoMinorLocator())
-        ax.tick_params(which='minor', length=2, color='k')
+        self._plotStackedHistogramOn(ax, parameterName, xLabel=xLabel, yLabel=yLabel, mainSampleBins=mainSampleBins, mainSampleRange=mainSampleRange, **kwargs)
         if toSave:
             if filename == "":
                 filename = parameterName.replace(" ", "_")
             plt.savefig(filename, bbox_inches='tight')
         plt.show()
 
-    def plotAllStackedHistograms(self, toSave=False, **kwargs):
+    def _plotStackedHistogramOn(self, ax, parameterName, xLabel="", yLabel="Count", mainSampleBins=15, mainSampleRange=None, **kwargs):
+        """
+        Draw the stacked histogram for the main sample and control samples for a given parameter on an existing Axes.
+
+        Args:
+            ax (matplotlib.axes.Axes): The Axes to draw on.
+            parameterName (str): The name of the parameter.
+            xLabel (str): The label for the x-axis (default is ""). If not specified, parameterName is used.
+            yLabel (str): The label for the y-axis (default is "Count").
+            mainSampleBins (int): The number of bins for the main sample's histogram, also used for the control samples unless bins is passed in kwargs (default is 15).
+            mainSampleRange (tuple): The range for the main sample's histogram, also used for the control samples unless range is passed in kwargs (default is None).
+            **kwargs: Additional keyword arguments for customizing the histograms.
+        """
+        if xLabel == "": 
+            xLabel = parameterName
+        ax.set_xlabel(xLabel)
+        ax.set_ylabel(yLabel)
+        values = self.getValuesForAllSamples(parameterName)
+        _, _, mainPatches = ax.hist(values[self.mainSample.name], label=self.mainSample.name, ec="black", histtype='step', range=mainSampleRange, fc=(0.5, 0.5, 0.5, 0.6), bins=mainSampleBins)
+        handles = [mainPatches[0]]
+        if self.controls:
+            # All control samples are drawn in one call, sharing the main sample's bins unless overridden
+            kwargs.setdefault('bins', mainSampleBins)
+            kwargs.setdefault('range', mainSampleRange)
+            _, _, controlPatches = ax.hist([values[controls.name] for controls in self.controls], label=[controls.name for controls in self.controls], histtype='stepfilled', stacked=False, **kwargs)
+            if len(self.controls) == 1:
+                controlPatches = [controlPatches]
+            # Matplotlib adds the datasets of a single hist call in reverse, so raise each control slightly
+            # above the previous one to keep later controls drawn on top
+            for order, patches in enumerate(controlPatches, start=1):
+                for patch in patches:
+                    patch.set_zorder(patch.get_zorder() + order * 1e-3)
+            handles += [patches[0] for patches in controlPatches]
+        # Labels starting with an underscore are left out of the legend, as Matplotlib does
+        legendEntries = [(handle, name) for handle, name in zip(handles, values) if not name.startswith('_')]
+        ax.legend([handle for handle, _ in legendEntries], [name for _, name in legendEntries])
+        ax.xaxis.set_minor_locator(AutoMinorLocator())
+        ax.tick_params(which='minor', length=2, color='k')
+        ax.yaxis.set_minor_locator(AutoMinorLocator())
+        ax.tick_params(which='minor', length=2, color='k')
+
+    def plotAllStackedHistograms(self, toSave=False, filename="", **kwargs):
         """
-        Plot stacked histograms for all parameters.
+        Plot stacked histograms for all parameters on a single grid of subplots.
 
         Args:
-            toSave (bool): Whether to save the plots as images (default is False).
+            toSave (bool): Whether to save the plot as an image (default is False).
+            filename (str): The filename to use if saving the plot (default is ""). If not specified, "stacked_histograms" is used.
             **kwargs: Additional keyword arguments for customizing the histograms.
         """
-        for parameters in self.parameters:
-            self.plotHistogram(parameters, toSave=toSave, **kwargs)
+        if len(self.parameters) == 0:
+            return
+        mpl.rcParams['font.size'] = 14
+        ncols = int(np.ceil(np.sqrt(len(self.parameters))))
+        nrows = int(np.ceil(len(self.parameters) / ncols))
+        fig, axes = plt.subplots(nrows, ncols, figsize=(6.4 * ncols, 4.8 * nrows), squeeze=False)
+        axes = axes.ravel()
+        for ax, parameterName in zip(axes, self.parameters):
+            self._plotStackedHistogramOn(ax, parameterName, **kwargs)
+        for ax in axes[len(self.parameters):]:
+            ax.set_visible(False)
+        fig.tight_layout()
+        if toSave:
+            if filename == "":
+                filename = "stacked_histograms"
+            plt.savefig(filename, bbox_inches='tight')
+        plt.show()
 
     def __str__(self):
         """